@@ -0,0 +1,59 @@
+"""
+Benchmark du temps de démarrage de etl.py.
+
+Mesure `import etl` et `python etl.py --help` dans des processus neufs et
+échoue (code de sortie 1) si le meilleur temps dépasse le seuil ou si un
+module lourd est chargé dès l'import : garde-fou contre les régressions.
+
+Usage : python benchmark_startup.py [seuil_en_secondes]   (défaut : 1.0)
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+RUNS = 5
+
+# Modules qui ne doivent être importés que par les étapes qui les utilisent
+LAZY_MODULES = ["snowflake", "sqlalchemy", "pyarrow.parquet", "dotenv"]
+
+COMMANDS = {
+    "import etl": [
+        sys.executable, "-c",
+        "import sys, etl; "
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]; "
+        "sys.exit(f'modules chargés à l import : {loaded}' if loaded else 0)"
+    ],
+    "etl.py --help": [sys.executable, os.path.join(ROOT, "etl.py"), "--help"],
+}
+
+
+def best_time(command):
+    """Meilleur temps sur RUNS exécutions (le processus doit réussir)."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(threshold=1.0):
+    failed = False
+    for name, command in COMMANDS.items():
+        try:
+            elapsed = best_time(command)
+        except subprocess.CalledProcessError:
+            print(f"{name:<15} ÉCHEC")
+            failed = True
+            continue
+        status = "OK" if elapsed < threshold else "TROP LENT"
+        failed = failed or elapsed >= threshold
+        print(f"{name:<15} {elapsed:.3f} s  (seuil {threshold:.1f} s)  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0))
@@ -0,0 +1,58 @@
+"""
+Benchmark du fait d'utilisation journalière (fact_utilisation_daily).
+
+Rejoue l'historique Bronze (locations + entretiens) décalé dans le temps pour
+simuler N fois plus d'historique, puis mesure le temps de construction.
+
+Usage : python benchmark_utilisation.py [facteur]   (défaut : 10)
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+from etl import BRONZE_DIR, apply_scd2, build_fact_utilisation_daily, generate_dim_date
+
+
+def replicate_history(df, date_cols, factor):
+    """Concatène `factor` copies de df, chaque copie décalée de la durée de l'historique."""
+    span = df[date_cols[0]].max() - df[date_cols[0]].min() + pd.Timedelta(days=1)
+    copies = []
+    for i in range(factor):
+        copy = df.copy()
+        for col in date_cols:
+            copy[col] = copy[col] + i * span
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def main(factor=10):
+    locations = pd.read_parquet(os.path.join(BRONZE_DIR, "locations.parquet"),
+                                columns=["vehicule_id", "date_debut", "date_fin"])
+    entretiens = pd.read_parquet(os.path.join(BRONZE_DIR, "entretiens.parquet"),
+                                 columns=["vehicule_id", "date_entretien"])
+    vehicles = pd.read_parquet(os.path.join(BRONZE_DIR, "Vehicles.parquet"),
+                               columns=["vehicule_id", "branch_id"])
+    branches = pd.read_parquet(os.path.join(BRONZE_DIR, "branches.parquet"),
+                               columns=["branch_id"])
+
+    dim_vehicule = apply_scd2(vehicles, None, "vehicule_id", "vehicule_key", ["branch_id"], 0)
+    dim_branch = branches.assign(branch_key=branches["branch_id"])
+
+    for n in (1, factor):
+        locs = replicate_history(locations, ["date_debut", "date_fin"], n)
+        ents = replicate_history(entretiens, ["date_entretien"], n)
+        end = max(locs["date_fin"].max(), ents["date_entretien"].max()) + pd.Timedelta(days=1)
+        dim_date = generate_dim_date(locs["date_debut"].min().date(), end.date())
+
+        start = time.perf_counter()
+        fact = build_fact_utilisation_daily(locs, ents, dim_date, dim_vehicule, dim_branch)
+        elapsed = time.perf_counter() - start
+        print(f"x{n:<3} {len(locs):>9} locations {len(ents):>7} entretiens "
+              f"-> {len(fact):>9} lignes en {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
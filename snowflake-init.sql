@@ -25,8 +25,13 @@ CREATE OR REPLACE TABLE DIM_CLIENT (
     EMAIL          VARCHAR(150),
     TELEPHONE      VARCHAR(20),
     ADRESSE        VARCHAR(255),
-    DATE_CREATION  DATE                     -- Date de création du client
-    BRANCH_ID      INT                      -- Référence à DIM_BRANCH (si applicable)
+    DATE_CREATION  DATE,                    -- Date de création du client
+    BRANCH_ID      INT,                     -- Référence à DIM_BRANCH (si applicable)
+    VALIDE_DEPUIS  INT,                     -- Début de validité de la version (date_key, incluse)
+    VALIDE_JUSQU_A INT,                     -- Fin de validité de la version (date_key, exclue)
+    EST_COURANT    BOOLEAN,                 -- Version courante du client
+    HASH_DIFF      BIGINT,                  -- Empreinte des attributs suivis (détection des changements)
+    HASH_VERSION   INT                      -- Format de normalisation utilisé pour HASH_DIFF
     -- CONSTRAINT FK_DIM_BRANCH FOREIGN KEY (BRANCH_ID) REFERENCES DIM_BRANCH(BRANCH_ID)
 );
 
@@ -39,8 +44,13 @@ CREATE OR REPLACE TABLE DIM_VEHICULE (
     MODELE             VARCHAR(100),
     ANNEE_FABRICATION  INT,
     IMMATRICULATION    VARCHAR(50),
-    STATUT             VARCHAR(50)          -- Statut initial (disponible, en location, etc.)
-    BRANCH_ID          INT                   -- Référence à DIM_BRANCH (si applicable)
+    STATUT             VARCHAR(50),         -- Statut initial (disponible, en location, etc.)
+    BRANCH_ID          INT,                 -- Référence à DIM_BRANCH (si applicable)
+    VALIDE_DEPUIS      INT,                 -- Début de validité de la version (date_key, incluse)
+    VALIDE_JUSQU_A     INT,                 -- Fin de validité de la version (date_key, exclue)
+    EST_COURANT        BOOLEAN,             -- Version courante du véhicule
+    HASH_DIFF          BIGINT,              -- Empreinte des attributs suivis (détection des changements)
+    HASH_VERSION       INT                  -- Format de normalisation utilisé pour HASH_DIFF
     -- CONSTRAINT FK_DIM_BRANCH FOREIGN KEY (BRANCH_ID) REFERENCES DIM_BRANCH(BRANCH_ID)
 );
 
@@ -52,9 +62,9 @@ CREATE OR REPLACE TABLE DIM_BRANCH (
     LOCALISATION  VARCHAR(150)
 );
 
--- Dimension Paiement (Optionnelle)
+-- Dimension Paiement (junk dimension : clés stables, complétée à chaque run)
 CREATE OR REPLACE TABLE DIM_PAIEMENT (
-    PAIEMENT_KEY    INT PRIMARY KEY,         -- Clé de dimension unique
+    PAIEMENT_KEY    SMALLINT PRIMARY KEY,    -- Clé de dimension unique
     MODE_PAIEMENT   VARCHAR(50),             -- Mode de paiement : carte, espèces, virement, etc.
     STATUT_PAIEMENT VARCHAR(20)              -- État : payée, impayée, remboursée
 );
@@ -72,6 +82,11 @@ CREATE OR REPLACE TABLE FACT_LOCATION (
     VEHICULE_KEY      INT,                   -- Référence à DIM_VEHICULE
     BRANCH_KEY        INT,                   -- Référence à DIM_BRANCH (si applicable)
     DUREE_LOCATION    FLOAT,                 -- Durée en heures (calculée à partir de date_debut et date_fin)
+    NB_JOURS_LOCATION INT,                   -- Nombre de jours facturés (journée entamée = journée due)
+    TARIF_JOURNALIER  DECIMAL(10,2),         -- Prix total rapporté à la durée en jours
+    PRIX_HORAIRE      DECIMAL(10,2),         -- Prix total rapporté à la durée en heures
+    PRIX_THEORIQUE    DECIMAL(10,2),         -- Prix attendu (prix de base * inflation 5%/an * jours)
+    PRIX_CONSTANT     DECIMAL(10,2),         -- Prix total corrigé de l'inflation (année de référence)
     PRIX_TOTAL        DECIMAL(10,2),         -- Montant total de la location
     STATUT_LOCATION   VARCHAR(50)            -- Statut de la location (confirmée, en cours, terminée, annulée)
     -- CONSTRAINT FK_DIM_CLIENT FOREIGN KEY (CLIENT_KEY) REFERENCES DIM_CLIENT(CLIENT_KEY),
@@ -85,10 +100,10 @@ CREATE OR REPLACE TABLE FACT_FACTURE (
     RENTAL_ID         INT,                   -- Référence à la location (peut être utile pour les analyses transverses)
     CLIENT_KEY        INT,                   -- Référence à DIM_CLIENT pour la traçabilité directe
     DATE_KEY_FACTURE  INT,                   -- Clé de la date de facturation (référence à DIM_DATE)
-    MONTANT           DECIMAL(10,2),         -- Montant facturé
-    MODE_PAIEMENT     VARCHAR(50),           -- Mode de paiement
-    STATUT_PAIEMENT   VARCHAR(20)            -- Statut du paiement (payée, impayée, remboursée)
-    -- CONSTRAINT FK_FACT_CLIENT FOREIGN KEY (CLIENT_KEY) REFERENCES DIM_CLIENT(CLIENT_KEY)
+    PAIEMENT_KEY      SMALLINT,              -- Référence à DIM_PAIEMENT (mode + statut du paiement)
+    MONTANT           DECIMAL(10,2)          -- Montant facturé
+    -- CONSTRAINT FK_FACT_CLIENT FOREIGN KEY (CLIENT_KEY) REFERENCES DIM_CLIENT(CLIENT_KEY),
+    -- CONSTRAINT FK_FACT_PAIEMENT FOREIGN KEY (PAIEMENT_KEY) REFERENCES DIM_PAIEMENT(PAIEMENT_KEY)
 );
 
 -- Fait Maintenance
@@ -102,3 +117,18 @@ CREATE OR REPLACE TABLE FACT_MAINTENANCE (
     -- CONSTRAINT FK_MAINT_VEHICULE FOREIGN KEY (VEHICULE_KEY) REFERENCES DIM_VEHICULE(VEHICULE_KEY),
     -- CONSTRAINT FK_MAINT_BRANCH FOREIGN KEY (BRANCH_KEY) REFERENCES DIM_BRANCH(BRANCH_KEY)
 );
+
+-- Fait Utilisation journalière (une ligne par véhicule et par jour avec activité)
+-- Les couples (véhicule, jour) sans location ni maintenance ne sont pas stockés :
+-- HEURES_LOCATION et HEURES_MAINTENANCE se somment, mais la table ne porte pas de
+-- mesure d'inactivité et AVG(TAUX_UTILISATION) ne concerne que les jours actifs.
+CREATE OR REPLACE TABLE FACT_UTILISATION_DAILY (
+    DATE_KEY             INT,               -- Référence à DIM_DATE
+    VEHICULE_KEY         INT,               -- Référence à DIM_VEHICULE
+    BRANCH_KEY           INT,               -- Référence à DIM_BRANCH
+    HEURES_LOCATION      FLOAT,             -- Heures en location sur la journée
+    HEURES_MAINTENANCE   FLOAT,             -- Heures immobilisées en maintenance
+    TAUX_UTILISATION     FLOAT              -- Heures en location / 24
+    -- CONSTRAINT FK_UTIL_VEHICULE FOREIGN KEY (VEHICULE_KEY) REFERENCES DIM_VEHICULE(VEHICULE_KEY),
+    -- CONSTRAINT FK_UTIL_BRANCH FOREIGN KEY (BRANCH_KEY) REFERENCES DIM_BRANCH(BRANCH_KEY)
+);